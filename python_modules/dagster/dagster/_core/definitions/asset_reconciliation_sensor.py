@@ -570,7 +570,7 @@ def get_execution_time_window_for_constraints(
 
     for constraint in sorted(constraints, key=lambda c: c.required_by_time):
         # the set of keys in this constraint that are actually upstream of this asset
-        relevant_constraint_keys = constraint.asset_keys & relevant_upstream_keys
+        relevant_constraint_keys = relevant_upstream_keys.intersection(constraint.asset_keys)
 
         if not all(
             # ensure that this constraint is not satisfied by the current state of the data and
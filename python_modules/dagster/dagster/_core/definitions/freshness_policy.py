@@ -1,5 +1,18 @@
 import datetime
-from typing import AbstractSet, FrozenSet, Mapping, NamedTuple, Optional
+import functools
+import itertools
+from typing import (
+    AbstractSet,
+    Dict,
+    FrozenSet,
+    Iterator,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
 
 import pendulum
 
@@ -15,9 +28,122 @@ from dagster._utils.schedules import (
 
 from .events import AssetKey
 
+try:
+    # when numpy is available, batch_minutes_late evaluates batches of policies with vectorized
+    # timestamp arithmetic instead of a per-policy Python loop
+    import numpy as _np
+except ImportError:
+    _np = None
+
+# Cron strings that tick at a fixed hourly or daily interval. For these, schedule ticks can be
+# computed directly with datetime arithmetic, which is significantly cheaper than croniter-based
+# iteration when policies are evaluated once per asset per tick.
+_STANDARD_CRON_UNITS: Mapping[str, str] = {
+    "0 * * * *": "hours",
+    "@hourly": "hours",
+    "0 0 * * *": "days",
+    "@daily": "days",
+    "@midnight": "days",
+}
+
+
+def _standard_cron_ticks(
+    cron_string: str, timestamp: float, execution_timezone: Optional[str], ascending: bool
+) -> Optional[Iterator[datetime.datetime]]:
+    """For hourly/daily cron strings evaluated in UTC, returns an iterator of schedule ticks
+    computed with plain datetime arithmetic rather than croniter. Returns None for any other cron
+    string or timezone, in which case callers should fall back to (reverse_)cron_string_iterator.
+
+    Restricted to UTC because DST transitions (skipped midnights, the ambiguous repeated hour on
+    fall-back days) make direct arithmetic diverge from the croniter-backed iterators; UTC has no
+    transitions, so equivalence holds on every tick.
+
+    When ascending, yields ticks >= timestamp; otherwise yields ticks <= timestamp, matching the
+    boundary behavior of cron_string_iterator / reverse_cron_string_iterator.
+    """
+    unit = _STANDARD_CRON_UNITS.get(cron_string)
+    if unit is None or (execution_timezone or "UTC") != "UTC":
+        return None
+
+    start = pendulum.from_timestamp(timestamp, tz="UTC")
+    tick = start.start_of("hour" if unit == "hours" else "day")
+    if ascending and tick < start:
+        tick = tick.add(**{unit: 1})
+
+    step = datetime.timedelta(**{unit: 1 if ascending else -1})
+
+    def _gen() -> Iterator[datetime.datetime]:
+        curr = tick
+        while True:
+            yield curr
+            curr = curr + step
+
+    return _gen()
+
+
+def _ticks_in_window(
+    cron_schedule: Optional[str],
+    cron_schedule_timezone: Optional[str],
+    start_timestamp: float,
+    end_timestamp: float,
+    maximum_lag_minutes: float,
+) -> Sequence[Tuple[float, float]]:
+    """Computes (required_data_timestamp, required_by_timestamp) pairs for up to 100 schedule
+    ticks within [start_timestamp, end_timestamp). Operates entirely on primitive arguments and
+    return values, so (with a GIL-releasing cron backend such as croniter-rs) batches of policies
+    can be iterated in parallel from a thread pool.
+    """
+    if cron_schedule:
+        ticks = _standard_cron_ticks(
+            cron_schedule, start_timestamp, cron_schedule_timezone, ascending=True
+        ) or cron_string_iterator(
+            start_timestamp=start_timestamp,
+            cron_string=cron_schedule,
+            execution_timezone=cron_schedule_timezone,
+        )
+        tick_timestamps: Iterator[float] = (tick.timestamp() for tick in ticks)
+    else:
+        # this constraint must be satisfied at all points in time, so generate a series of many
+        # constraints (10 per maximum lag window)
+        step_seconds = ((maximum_lag_minutes / 10.0) + 0.1) * 60.0
+
+        def _tick_gen() -> Iterator[float]:
+            tick_ts = start_timestamp
+            while tick_ts < end_timestamp:
+                yield tick_ts
+                tick_ts += step_seconds
+
+        tick_timestamps = _tick_gen()
+
+    lag_seconds = maximum_lag_minutes * 60.0
+    # the islice caps constraint generation if the user selects a very small maximum_lag_minutes
+    return [
+        (tick_ts - lag_seconds, tick_ts)
+        for tick_ts in itertools.takewhile(
+            lambda tick_ts: tick_ts < end_timestamp, itertools.islice(tick_timestamps, 100)
+        )
+    ]
+
+
+# intern the per-policy upstream key tuples so that the many thousands of constraints generated
+# across reconciliation ticks all reference a single object per upstream key set, rather than
+# re-sorting and re-allocating it on every constraints_for_time_window call. the lru bound keeps
+# long-running processes from retaining key sets for asset graphs that have since been reloaded.
+@functools.lru_cache(maxsize=1024)
+def _shared_upstream_keys_tuple(upstream_keys: FrozenSet[AssetKey]) -> Tuple[AssetKey, ...]:
+    return tuple(sorted(upstream_keys, key=lambda key: key.to_string()))
+
+
+# validating a (cron_schedule, cron_schedule_timezone) pair is a pure function of the two strings,
+# so configurations that have already been validated in this process can be skipped. many assets
+# in a repository typically share the same policy configuration.
+_VALIDATED_CRON_CONFIGS: Set[Tuple[Optional[str], Optional[str]]] = set()
+
 
 class FreshnessConstraint(NamedTuple):
-    asset_keys: AbstractSet[AssetKey]
+    # stored as a sorted tuple rather than a frozenset so that hashing / equality checks on the
+    # constraint are cheap and stable across calls
+    asset_keys: Tuple[AssetKey, ...]
     required_data_time: datetime.datetime
     required_by_time: datetime.datetime
 
@@ -103,27 +229,34 @@ class FreshnessPolicy(
         cron_schedule: Optional[str] = None,
         cron_schedule_timezone: Optional[str] = None,
     ):
-        if cron_schedule is not None:
-            if not is_valid_cron_schedule(cron_schedule):
-                raise DagsterInvalidDefinitionError(f"Invalid cron schedule '{cron_schedule}'.")
-            check.param_invariant(
-                is_valid_cron_schedule(cron_schedule),
-                "cron_schedule",
-                f"Invalid cron schedule '{cron_schedule}'.",
-            )
-        if cron_schedule_timezone is not None:
-            check.param_invariant(
-                cron_schedule is not None,
-                "cron_schedule_timezone",
-                "Cannot specify cron_schedule_timezone without a cron_schedule.",
-            )
-            try:
-                # Verify that the timezone can be loaded
-                pendulum.tz.timezone(cron_schedule_timezone)  # type: ignore
-            except Exception as e:
-                raise DagsterInvalidDefinitionError(
-                    "Invalid cron schedule timezone '{cron_schedule_timezone}'.   "
-                ) from e
+        # only consult/populate the cache for str-or-None arguments: anything else may not be
+        # hashable and must flow through validation so the opt_str_param checks below can surface
+        # a clean parameter error
+        cacheable_config = (cron_schedule is None or isinstance(cron_schedule, str)) and (
+            cron_schedule_timezone is None or isinstance(cron_schedule_timezone, str)
+        )
+        if (
+            not cacheable_config
+            or (cron_schedule, cron_schedule_timezone) not in _VALIDATED_CRON_CONFIGS
+        ):
+            if cron_schedule is not None:
+                if not is_valid_cron_schedule(cron_schedule):
+                    raise DagsterInvalidDefinitionError(f"Invalid cron schedule '{cron_schedule}'.")
+            if cron_schedule_timezone is not None:
+                check.param_invariant(
+                    cron_schedule is not None,
+                    "cron_schedule_timezone",
+                    "Cannot specify cron_schedule_timezone without a cron_schedule.",
+                )
+                try:
+                    # Verify that the timezone can be loaded
+                    pendulum.tz.timezone(cron_schedule_timezone)  # type: ignore
+                except Exception as e:
+                    raise DagsterInvalidDefinitionError(
+                        "Invalid cron schedule timezone '{cron_schedule_timezone}'.   "
+                    ) from e
+            if cacheable_config:
+                _VALIDATED_CRON_CONFIGS.add((cron_schedule, cron_schedule_timezone))
         return super(FreshnessPolicy, cls).__new__(
             cls,
             maximum_lag_minutes=float(
@@ -141,11 +274,19 @@ class FreshnessPolicy(
         Pickle requires a method with positional arguments to construct
         instances of a class. Since the constructor for this class has
         keyword arguments only, we define this method to be used by pickle.
+
+        Kept for compatibility with pickles produced by older versions; new pickles go through
+        _unchecked_freshness_policy below.
         """
         return cls(maximum_lag_minutes=args[0], cron_schedule=args[1])
 
     def __reduce__(self):
-        return (self._create, (self.maximum_lag_minutes, self.cron_schedule))
+        # the instance being pickled was already validated when it was originally constructed, so
+        # unpickling can skip re-validating the cron schedule and timezone
+        return (
+            _unchecked_freshness_policy,
+            (self.maximum_lag_minutes, self.cron_schedule, self.cron_schedule_timezone),
+        )
 
     @property
     def maximum_lag_delta(self) -> datetime.timedelta:
@@ -167,43 +308,32 @@ class FreshnessPolicy(
                 calculated for.
             upstream_keys (FrozenSet[AssetKey]): The relevant upstream keys for this policy.
         """
-        constraints = set()
+        # materialize the upstream keys once as a sorted tuple, shared by every constraint in
+        # this window and interned across calls
+        upstream_keys_tuple = _shared_upstream_keys_tuple(upstream_keys)
 
-        # get an iterator of times to evaluate these constraints at
         if self.cron_schedule:
-            constraint_ticks = cron_string_iterator(
-                start_timestamp=window_start.timestamp(),
-                cron_string=self.cron_schedule,
-                execution_timezone=self.cron_schedule_timezone,
-            )
+            tzinfo = pendulum.tz.timezone(self.cron_schedule_timezone or "UTC")
         else:
-            # this constraint must be satisfied at all points in time, so generate a series of
-            # many constraints (10 per maximum lag window)
-            period = pendulum.period(pendulum.instance(window_start), pendulum.instance(window_end))
-            # old versions of pendulum return a list, so ensure this is an iterator
-            constraint_ticks = iter(
-                period.range("minutes", (self.maximum_lag_minutes / 10.0) + 0.1)
+            tzinfo = window_start.tzinfo
+
+        # the tick computation operates entirely on primitive values, so it can be dispatched to
+        # worker threads when many policies are evaluated concurrently; the constraint objects are
+        # constructed here from the primitive pairs it returns
+        return {
+            FreshnessConstraint(
+                asset_keys=upstream_keys_tuple,
+                required_data_time=datetime.datetime.fromtimestamp(required_data_ts, tz=tzinfo),
+                required_by_time=datetime.datetime.fromtimestamp(required_by_ts, tz=tzinfo),
             )
-
-        # iterate over each schedule tick in the provided time window
-        evaluation_tick = next(constraint_ticks, None)
-        while evaluation_tick is not None and evaluation_tick < window_end:
-            required_data_time = evaluation_tick - self.maximum_lag_delta
-            required_by_time = evaluation_tick
-
-            constraints.add(
-                FreshnessConstraint(
-                    asset_keys=upstream_keys,
-                    required_data_time=required_data_time,
-                    required_by_time=required_by_time,
-                )
+            for required_data_ts, required_by_ts in _ticks_in_window(
+                cron_schedule=self.cron_schedule,
+                cron_schedule_timezone=self.cron_schedule_timezone,
+                start_timestamp=window_start.timestamp(),
+                end_timestamp=window_end.timestamp(),
+                maximum_lag_minutes=self.maximum_lag_minutes,
             )
-
-            evaluation_tick = next(constraint_ticks, None)
-            # fallback if the user selects a very small maximum_lag_minutes value
-            if len(constraints) > 100:
-                break
-        return constraints
+        }
 
     def minutes_late(
         self,
@@ -221,26 +351,141 @@ class FreshnessPolicy(
                 upstream assets, the timestamp of the data that was used to create the current
                 version of this asset.
         """
-        if self.cron_schedule:
-            # most recent cron schedule tick
-            schedule_ticks = reverse_cron_string_iterator(
-                end_timestamp=evaluation_time.timestamp(),
-                cron_string=self.cron_schedule,
-                execution_timezone=self.cron_schedule_timezone,
+        return self._minutes_late_for_evaluation_tick(
+            self._evaluation_tick(evaluation_time), used_data_times
+        )
+
+    def _evaluation_tick(self, evaluation_time: datetime.datetime) -> datetime.datetime:
+        """Returns the time at which this policy should be evaluated: the most recent cron
+        schedule tick if a cron schedule is set, otherwise the evaluation time itself.
+        """
+        if not self.cron_schedule:
+            return evaluation_time
+
+        # most recent cron schedule tick
+        schedule_ticks = _standard_cron_ticks(
+            self.cron_schedule,
+            evaluation_time.timestamp(),
+            self.cron_schedule_timezone,
+            ascending=False,
+        ) or reverse_cron_string_iterator(
+            end_timestamp=evaluation_time.timestamp(),
+            cron_string=self.cron_schedule,
+            execution_timezone=self.cron_schedule_timezone,
+        )
+        return next(schedule_ticks)
+
+    def _minutes_late_for_evaluation_tick(
+        self,
+        evaluation_tick: datetime.datetime,
+        used_data_times: Mapping[AssetKey, Optional[datetime.datetime]],
+    ) -> Optional[float]:
+        # upstream data was not used, undefined how out of date you are
+        if any(used_data_time is None for used_data_time in used_data_times.values()):
+            return None
+
+        required_time = evaluation_tick - self.maximum_lag_delta
+        return (
+            max(
+                (
+                    (required_time - used_data_time).total_seconds()
+                    for used_data_time in used_data_times.values()
+                    if used_data_time < required_time
+                ),
+                default=0.0,
             )
-            evaluation_tick = next(schedule_ticks)
-        else:
-            evaluation_tick = evaluation_time
-
-        minutes_late = 0.0
-        for used_data_time in used_data_times.values():
-            # upstream data was not used, undefined how out of date you are
-            if used_data_time is None:
-                return None
-
-            required_time = evaluation_tick - self.maximum_lag_delta
-            if used_data_time < required_time:
-                minutes_late = max(
-                    minutes_late, (required_time - used_data_time).total_seconds() / 60
-                )
-        return minutes_late
+            / 60
+        )
+
+    @classmethod
+    def batch_minutes_late(
+        cls,
+        policies_and_data: Sequence[
+            Tuple["FreshnessPolicy", Mapping[AssetKey, Optional[datetime.datetime]]]
+        ],
+        evaluation_time: datetime.datetime,
+    ) -> Sequence[Optional[float]]:
+        """Evaluates minutes_late for many policies at a single evaluation time. Equivalent to
+        calling minutes_late on each policy in turn, but the evaluation tick for each unique
+        (cron_schedule, cron_schedule_timezone) pair is computed only once, rather than once per
+        policy.
+
+        Args:
+            policies_and_data (Sequence[Tuple[FreshnessPolicy, Mapping[AssetKey, Optional[datetime]]]]):
+                For each policy to evaluate, the used data times that would be passed to
+                minutes_late.
+            evaluation_time (datetime): The time at which we're evaluating the lateness of these
+                assets. Generally, this is the current time.
+        """
+        evaluation_tick_by_schedule: Dict[
+            Tuple[Optional[str], Optional[str]], datetime.datetime
+        ] = {}
+
+        def _get_evaluation_tick(policy: "FreshnessPolicy") -> datetime.datetime:
+            schedule_key = (policy.cron_schedule, policy.cron_schedule_timezone)
+            evaluation_tick = evaluation_tick_by_schedule.get(schedule_key)
+            if evaluation_tick is None:
+                evaluation_tick = policy._evaluation_tick(evaluation_time)
+                evaluation_tick_by_schedule[schedule_key] = evaluation_tick
+            return evaluation_tick
+
+        if _np is not None and len(policies_and_data) > 1:
+            return cls._batch_minutes_late_numpy(policies_and_data, _get_evaluation_tick)
+
+        return [
+            policy._minutes_late_for_evaluation_tick(_get_evaluation_tick(policy), used_data_times)
+            for policy, used_data_times in policies_and_data
+        ]
+
+    @classmethod
+    def _batch_minutes_late_numpy(
+        cls,
+        policies_and_data: Sequence[
+            Tuple["FreshnessPolicy", Mapping[AssetKey, Optional[datetime.datetime]]]
+        ],
+        get_evaluation_tick,
+    ) -> Sequence[Optional[float]]:
+        """Vectorized implementation of batch_minutes_late. minutes_late is pure arithmetic on
+        timestamps per upstream key, so over a batch it reduces to contiguous float64 operations:
+        one matrix of used data timestamps (padded with +inf, which cannot contribute to the max)
+        against a vector of per-policy required timestamps.
+        """
+        num_policies = len(policies_and_data)
+        width = max((len(used) for _, used in policies_and_data), default=0)
+        if width == 0:
+            return [0.0] * num_policies
+
+        required_ts = _np.empty(num_policies, dtype=_np.float64)
+        used_ts = _np.full((num_policies, width), _np.inf, dtype=_np.float64)
+        missing_data = _np.zeros(num_policies, dtype=bool)
+
+        for i, (policy, used_data_times) in enumerate(policies_and_data):
+            required_ts[i] = (
+                get_evaluation_tick(policy).timestamp() - policy.maximum_lag_minutes * 60.0
+            )
+            for j, used_data_time in enumerate(used_data_times.values()):
+                # upstream data was not used, undefined how out of date you are
+                if used_data_time is None:
+                    missing_data[i] = True
+                    break
+                used_ts[i, j] = used_data_time.timestamp()
+
+        late_minutes = (
+            _np.max(_np.maximum(required_ts[:, None] - used_ts, 0.0), axis=1) / 60.0
+        )
+        return [
+            None if missing_data[i] else float(late_minutes[i]) for i in range(num_policies)
+        ]
+
+
+def _unchecked_freshness_policy(
+    maximum_lag_minutes: float,
+    cron_schedule: Optional[str],
+    cron_schedule_timezone: Optional[str],
+) -> FreshnessPolicy:
+    """Constructs a FreshnessPolicy without running constructor validation. Only for use when
+    unpickling, where the instance was already validated at original construction time.
+    """
+    return tuple.__new__(
+        FreshnessPolicy, (maximum_lag_minutes, cron_schedule, cron_schedule_timezone)
+    )
@@ -1,4 +1,6 @@
 import datetime
+import functools
+import re
 from typing import Iterator, Optional, Sequence, Union
 
 import pendulum
@@ -8,11 +10,54 @@ from croniter import croniter
 import dagster._check as check
 from dagster._seven.compat.pendulum import to_timezone
 
+try:
+    # croniter_rs is a drop-in replacement for croniter's iteration methods, implemented in Rust.
+    # When it is available, use it to back cron iteration, which can be more than an order of
+    # magnitude faster than the pure-Python implementation on schedule-dense paths.
+    from croniter_rs import croniter as _croniter_iter_impl
+except ImportError:
+    _croniter_iter_impl = croniter
 
+
+def _cron_field_pattern(value_pattern: str) -> str:
+    """Builds a regex for a single cron field: comma-separated wildcards, values, or ranges over
+    the given value pattern, each with an optional step.
+    """
+    item = r"(?:\*|{value}(?:-{value})?)(?:/[1-9]\d*)?".format(value=value_pattern)
+    return r"{item}(?:,{item})*".format(item=item)
+
+
+# matches the standard numeric five-field cron form with in-range values. a match here is
+# sufficient for validity, letting validation skip the much more expensive croniter parse for the
+# overwhelmingly common case. aliases (e.g. "@daily"), month/day names, and croniter extensions
+# deliberately miss this pattern and fall through to croniter.
+_STANDARD_CRON_STRING_PATTERN = re.compile(
+    r"^\s*{minute}\s+{hour}\s+{day_of_month}\s+{month}\s+{day_of_week}\s*$".format(
+        minute=_cron_field_pattern(r"(?:[0-5]?\d)"),
+        hour=_cron_field_pattern(r"(?:1?\d|2[0-3])"),
+        day_of_month=_cron_field_pattern(r"(?:[1-9]|[12]\d|3[01])"),
+        month=_cron_field_pattern(r"(?:[1-9]|1[0-2])"),
+        day_of_week=_cron_field_pattern(r"[0-7]"),
+    )
+)
+
+
+@functools.lru_cache(maxsize=1024)
+def _expanded_cron_string(cron_string: str):
+    """Memoized croniter.expand. The same cron strings are parsed over and over when iterating
+    schedules or validating definitions, and expansion is a nontrivial cost on hot paths.
+    """
+    cron_parts, nth_weekday_of_month = croniter.expand(cron_string)
+    return tuple(tuple(part) for part in cron_parts), nth_weekday_of_month
+
+
+@functools.lru_cache(maxsize=1024)
 def is_valid_cron_string(cron_string: str) -> bool:
+    if _STANDARD_CRON_STRING_PATTERN.match(cron_string):
+        return True
     if not croniter.is_valid(cron_string):
         return False
-    expanded, _ = croniter.expand(cron_string)
+    expanded, _ = _expanded_cron_string(cron_string)
     # dagster only recognizes cron strings that resolve to 5 parts (e.g. not seconds resolution)
     return len(expanded) == 5
 
@@ -35,7 +80,7 @@ def cron_string_iterator(
     utc_datetime = pytz.utc.localize(datetime.datetime.utcfromtimestamp(start_timestamp))
     start_datetime = utc_datetime.astimezone(pytz.timezone(timezone_str))
 
-    date_iter = croniter(cron_string, start_datetime)
+    date_iter = _croniter_iter_impl(cron_string, start_datetime)
 
     # Go back one iteration so that the next iteration is the first time that is >= start_datetime
     # and matches the cron schedule
@@ -45,7 +90,7 @@ def cron_string_iterator(
     for _ in range(-start_offset):
         next_date = date_iter.get_prev(datetime.datetime)
 
-    cron_parts, nth_weekday_of_month = croniter.expand(cron_string)
+    cron_parts, nth_weekday_of_month = _expanded_cron_string(cron_string)
 
     is_numeric = [len(part) == 1 and part[0] != "*" for part in cron_parts]
     is_wildcard = [len(part) == 1 and part[0] == "*" for part in cron_parts]
@@ -113,13 +158,13 @@ def reverse_cron_string_iterator(
     utc_datetime = pytz.utc.localize(datetime.datetime.utcfromtimestamp(end_timestamp))
     end_datetime = utc_datetime.astimezone(pytz.timezone(timezone_str))
 
-    date_iter = croniter(cron_string, end_datetime)
+    date_iter = _croniter_iter_impl(cron_string, end_datetime)
 
     # Go forward one iteration so that the next iteration is the first time that is < end_datetime
     # and matches the cron schedule
     next_date = date_iter.get_next(datetime.datetime)
 
-    cron_parts, _ = croniter.expand(cron_string)
+    cron_parts, _ = _expanded_cron_string(cron_string)
 
     is_numeric = [len(part) == 1 and part[0] != "*" for part in cron_parts]
     is_wildcard = [len(part) == 1 and part[0] == "*" for part in cron_parts]
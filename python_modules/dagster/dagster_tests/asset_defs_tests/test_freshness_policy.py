@@ -1,9 +1,12 @@
+import pickle
+
 import pytest
 from dagster import AssetKey
 from dagster._check import ParameterCheckError
-from dagster._core.definitions.freshness_policy import FreshnessPolicy
+from dagster._core.definitions.freshness_policy import FreshnessPolicy, _standard_cron_ticks
 from dagster._core.errors import DagsterInvalidDefinitionError
 from dagster._seven.compat.pendulum import create_pendulum_time
+from dagster._utils.schedules import cron_string_iterator, reverse_cron_string_iterator
 
 
 @pytest.mark.parametrize(
@@ -130,6 +133,109 @@ def test_policies_available_equals_evaluation_time(
     assert minutes_late == expected_minutes_late
 
 
+@pytest.mark.parametrize(
+    "cron_string", ["0 * * * *", "@hourly", "0 0 * * *", "@daily", "@midnight"]
+)
+@pytest.mark.parametrize(
+    "seed_time",
+    [
+        # exactly on a tick
+        create_pendulum_time(2022, 1, 1, 0, 0),
+        # mid-interval
+        create_pendulum_time(2022, 1, 1, 4, 30),
+        # US spring-forward day
+        create_pendulum_time(2022, 3, 13, 9, 45),
+        # US fall-back day
+        create_pendulum_time(2022, 11, 6, 5, 30),
+    ],
+)
+def test_standard_cron_ticks_match_cron_string_iterator(cron_string, seed_time):
+    seed_timestamp = seed_time.timestamp()
+
+    fast_ticks = _standard_cron_ticks(cron_string, seed_timestamp, None, ascending=True)
+    baseline_ticks = cron_string_iterator(seed_timestamp, cron_string, None)
+    for _ in range(48):
+        assert next(fast_ticks).timestamp() == next(baseline_ticks).timestamp()
+
+    fast_ticks = _standard_cron_ticks(cron_string, seed_timestamp, "UTC", ascending=False)
+    baseline_ticks = reverse_cron_string_iterator(seed_timestamp, cron_string, None)
+    for _ in range(48):
+        assert next(fast_ticks).timestamp() == next(baseline_ticks).timestamp()
+
+
+def test_standard_cron_ticks_fall_back_outside_utc():
+    # DST transitions (ambiguous fall-back hours, midnight-skipping timezones) make direct
+    # arithmetic diverge from croniter, so the fast path must decline anything but UTC and let
+    # the croniter-backed iterators handle it
+    seed_timestamp = create_pendulum_time(2022, 11, 6, 5, 30).timestamp()
+    for timezone in ["America/New_York", "America/Santiago", "America/Havana"]:
+        assert _standard_cron_ticks("0 * * * *", seed_timestamp, timezone, ascending=True) is None
+        assert _standard_cron_ticks("0 0 * * *", seed_timestamp, timezone, ascending=False) is None
+    assert _standard_cron_ticks("* * * * *", seed_timestamp, None, ascending=True) is None
+    assert _standard_cron_ticks("0 * * * *", seed_timestamp, None, ascending=True) is not None
+
+
+def test_minutes_late_hourly_during_fall_back_hour():
+    # regression: evaluating an hourly policy inside the repeated fall-back hour must not resolve
+    # the evaluation tick to a future schedule tick
+    policy = FreshnessPolicy(
+        maximum_lag_minutes=60,
+        cron_schedule="0 * * * *",
+        cron_schedule_timezone="America/New_York",
+    )
+    # 2022-11-06 05:30 UTC is 01:30 EDT, inside the repeated hour; the most recent tick is
+    # 05:00 UTC, so data from 03:10 UTC is 50 minutes behind the required 04:00 UTC
+    evaluation_time = create_pendulum_time(2022, 11, 6, 5, 30)
+
+    minutes_late = policy.minutes_late(
+        evaluation_time=evaluation_time,
+        used_data_times={AssetKey("root"): create_pendulum_time(2022, 11, 6, 3, 10)},
+    )
+
+    assert minutes_late == 50.0
+
+
+def test_batch_minutes_late():
+    evaluation_time = create_pendulum_time(2022, 1, 2, 0, 10)
+    policies_and_data = [
+        (
+            FreshnessPolicy(maximum_lag_minutes=30),
+            {AssetKey("root"): create_pendulum_time(2022, 1, 1, 23, 0)},
+        ),
+        (
+            FreshnessPolicy(cron_schedule="@daily", maximum_lag_minutes=15),
+            {AssetKey("root"): create_pendulum_time(2022, 1, 1, 23, 55)},
+        ),
+        (
+            FreshnessPolicy(cron_schedule="@daily", maximum_lag_minutes=60),
+            {AssetKey("root"): create_pendulum_time(2022, 1, 1, 22, 0)},
+        ),
+        (
+            FreshnessPolicy(cron_schedule="@hourly", maximum_lag_minutes=60),
+            {AssetKey("root"): None},
+        ),
+    ]
+
+    results = FreshnessPolicy.batch_minutes_late(policies_and_data, evaluation_time)
+
+    assert results == [
+        policy.minutes_late(evaluation_time=evaluation_time, used_data_times=used_data_times)
+        for policy, used_data_times in policies_and_data
+    ]
+
+
+def test_freshness_policy_pickle_round_trip():
+    policy = FreshnessPolicy(
+        maximum_lag_minutes=60,
+        cron_schedule="0 3 * * *",
+        cron_schedule_timezone="America/Los_Angeles",
+    )
+    assert pickle.loads(pickle.dumps(policy)) == policy
+
+    no_cron_policy = FreshnessPolicy(maximum_lag_minutes=30)
+    assert pickle.loads(pickle.dumps(no_cron_policy)) == no_cron_policy
+
+
 def test_invalid_freshness_policies():
     with pytest.raises(DagsterInvalidDefinitionError, match="Invalid cron schedule"):
         FreshnessPolicy(cron_schedule="xyz-123-bad-schedule", maximum_lag_minutes=60)
@@ -143,3 +249,7 @@ def test_invalid_freshness_policies():
 
     with pytest.raises(ParameterCheckError, match="without a cron_schedule"):
         FreshnessPolicy(maximum_lag_minutes=0, cron_schedule_timezone="America/Los_Angeles")
+
+    # non-str cron schedules surface a clean parameter error, even though they are not hashable
+    with pytest.raises(ParameterCheckError, match="cron_schedule"):
+        FreshnessPolicy(maximum_lag_minutes=60, cron_schedule=["0 1 * * *"])